@@ -1,10 +1,16 @@
 import os
 import sys
 import logging
-from flask import Flask, request, jsonify, send_from_directory
-from werkzeug.utils import secure_filename
-from datetime import datetime
-import tempfile
+import io
+import gzip
+import hashlib
+import mimetypes
+import threading
+from collections import OrderedDict
+from urllib.parse import unquote
+import orjson
+from flask import Flask, Request, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 
 # Import the clinical ECG analyzer
 from clinical_ecg_analyzer import ClinicalECGAnalyzer
@@ -13,569 +19,298 @@ from clinical_ecg_analyzer import ClinicalECGAnalyzer
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__, static_folder='static', static_url_path='')
+class ECGRequest(Request):
+    """Request that keeps file uploads in memory"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Uploads are capped by MAX_CONTENT_LENGTH and the analyzer works on
+        # bytes, so there is no need to spill them to disk.
+        return io.BytesIO()
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib encoder
+
+    Output is UTF-8 rather than ASCII-escaped; setting ensure_ascii back to
+    True (or passing it) routes through the stdlib encoder.
+    """
+
+    ensure_ascii = False
+
+    # orjson always writes json.dumps' compact separators
+    _COMPACT_SEPARATORS = (',', ':')
+
+    def _option(self, sort_keys, indent):
+        # Non-str keys are coerced to strings, as the stdlib encoder does, and
+        # dates are left to self.default so they keep Flask's HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        default = kwargs.pop('default', self.default)
+        sort_keys = kwargs.pop('sort_keys', self.sort_keys)
+        ensure_ascii = kwargs.pop('ensure_ascii', self.ensure_ascii)
+        indent = kwargs.pop('indent', None)
+        separators = kwargs.get('separators')
+        if separators is not None and tuple(separators) == self._COMPACT_SEPARATORS:
+            del kwargs['separators']
+        if not kwargs and not ensure_ascii and indent in (None, 2):
+            try:
+                return orjson.dumps(obj, default=default, option=self._option(sort_keys, indent)).decode('utf-8')
+            except orjson.JSONEncodeError:
+                # e.g. integers wider than 64 bits, which the stdlib encoder accepts
+                pass
+        # orjson has no equivalent for these options; use the stdlib encoder
+        return super().dumps(
+            obj, default=default, sort_keys=sort_keys, ensure_ascii=ensure_ascii,
+            indent=indent, **kwargs
+        )
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self.ensure_ascii:
+            return super().response(*args, **kwargs)
+        # orjson already returns bytes, so skip the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        # Pretty-print under the same conditions as the default provider
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._option(self.sort_keys, indent))
+        except orjson.JSONEncodeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+class ResultCache:
+    """Thread-safe LRU of serialized analysis responses keyed by content digest"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key, body):
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+# Static assets worth compressing; images other than the icon already are
+_COMPRESSIBLE_SUFFIXES = ('.html', '.css', '.js', '.ico')
+
+def content_etag(body):
+    """Short content-derived ETag for a response body"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def precompress_static(folder):
+    """Gzip compressible static assets once, keyed by their path under the static folder"""
+    precompressed = {}
+    for root, _, names in os.walk(folder):
+        for name in names:
+            if name.endswith(_COMPRESSIBLE_SUFFIXES):
+                path = os.path.join(root, name)
+                with open(path, 'rb') as f:
+                    body = gzip.compress(f.read(), 9)
+                key = os.path.relpath(path, folder).replace(os.sep, '/')
+                precompressed[key] = (body, content_etag(body), int(os.path.getmtime(path)))
+    return precompressed
+
+class ECGFlask(Flask):
+    """Flask app that serves gzip copies of static text assets built at startup"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.precompressed_static = precompress_static(self.static_folder)
+
+    def get_send_file_max_age(self, filename):
+        # Only the build's content-hashed bundles can be cached without
+        # revalidation; the HTML shells and the icon keep their names across
+        # deploys, so clients must revalidate them
+        if filename is not None and filename.startswith('assets/'):
+            return super().get_send_file_max_age(filename)
+        return None
+
+    def send_static_file(self, filename):
+        entry = self.precompressed_static.get(filename)
+        if entry is None or not request.accept_encodings['gzip']:
+            response = super().send_static_file(filename)
+        else:
+            body, etag, mtime = entry
+            response = self.response_class(
+                body, mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            )
+            response.headers['Content-Encoding'] = 'gzip'
+            # Same cache policy as send_file applies to the identity copy
+            max_age = self.get_send_file_max_age(filename)
+            if max_age is None:
+                response.cache_control.no_cache = True
+            else:
+                response.cache_control.public = True
+                response.cache_control.max_age = max_age
+            response.set_etag(etag)
+            response.last_modified = mtime
+            response = response.make_conditional(request)
+        response.vary.add('Accept-Encoding')
+        return response
+
+app = ECGFlask(__name__, static_folder='static', static_url_path='')
+app.request_class = ECGRequest
+app.json = ORJSONProvider(app)
+app.json.sort_keys = False  # Clients read fields by name; skip the sort pass
+app.url_map.strict_slashes = False
 
 # Configuration
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'bmp', 'tiff', 'gif'}
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 86400  # Cache hashed build assets for a day
+ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'bmp', 'tiff', 'gif'})
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
+
+# Leading bytes of the accepted image formats
+_IMAGE_SIGNATURES = (
+    b'\x89PNG\r\n\x1a\n',   # PNG
+    b'\xff\xd8\xff',        # JPEG
+    b'BM',                  # BMP
+    b'II*\x00', b'MM\x00*', # TIFF
+    b'GIF87a', b'GIF89a',   # GIF
+)
 
 # Initialize the clinical ECG analyzer
 ecg_analyzer = ClinicalECGAnalyzer()
 
+# Analysis is deterministic per image, so repeat uploads reuse the response
+result_cache = ResultCache(maxsize=256)
+
+@app.before_request
+def reject_oversized_body():
+    """Refuse bodies over MAX_CONTENT_LENGTH before any of it is read"""
+    content_length = request.content_length
+    if content_length is not None and content_length > app.config['MAX_CONTENT_LENGTH']:
+        return jsonify({'success': False, 'error': 'File size must be less than 16MB'}), 413
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+def is_image_data(data):
+    """Check the file's magic bytes against the accepted image formats"""
+    return data.startswith(_IMAGE_SIGNATURES)
+
+# The interpreter page is read and compressed once at import
+_INDEX_PATH = os.path.join(app.static_folder, 'interpreter.html')
+with open(_INDEX_PATH, 'rb') as f:
+    _INDEX_HTML = f.read()
+_INDEX_ETAG = content_etag(_INDEX_HTML)
+_INDEX_HTML_GZ, _INDEX_GZ_ETAG, _INDEX_MTIME = app.precompressed_static['interpreter.html']
 
 @app.route('/')
 def index():
     """Serve the main application page"""
-    return '''
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>ECG Interpreter - Clinical Grade Analysis</title>
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                padding: 20px;
-            }
-            
-            .container {
-                max-width: 800px;
-                margin: 0 auto;
-                background: white;
-                border-radius: 20px;
-                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                overflow: hidden;
-            }
-            
-            .header {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 30px;
-                text-align: center;
-            }
-            
-            .header h1 {
-                font-size: 2.5em;
-                margin-bottom: 10px;
-                font-weight: 300;
-            }
-            
-            .header p {
-                font-size: 1.1em;
-                opacity: 0.9;
-            }
-            
-            .content {
-                padding: 40px;
-            }
-            
-            .upload-area {
-                border: 3px dashed #667eea;
-                border-radius: 15px;
-                padding: 40px;
-                text-align: center;
-                margin-bottom: 30px;
-                transition: all 0.3s ease;
-                cursor: pointer;
-            }
-            
-            .upload-area:hover {
-                border-color: #764ba2;
-                background: #f8f9ff;
-            }
-            
-            .upload-area.dragover {
-                border-color: #764ba2;
-                background: #f0f2ff;
-                transform: scale(1.02);
-            }
-            
-            .upload-icon {
-                font-size: 3em;
-                color: #667eea;
-                margin-bottom: 20px;
-            }
-            
-            .upload-text {
-                font-size: 1.2em;
-                color: #666;
-                margin-bottom: 15px;
-            }
-            
-            .upload-subtext {
-                color: #999;
-                font-size: 0.9em;
-            }
-            
-            #fileInput {
-                display: none;
-            }
-            
-            .btn {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 25px;
-                font-size: 1em;
-                cursor: pointer;
-                transition: all 0.3s ease;
-                margin: 10px;
-            }
-            
-            .btn:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-            }
-            
-            .btn:disabled {
-                opacity: 0.6;
-                cursor: not-allowed;
-                transform: none;
-            }
-            
-            .results {
-                margin-top: 30px;
-                padding: 25px;
-                background: #f8f9ff;
-                border-radius: 15px;
-                border-left: 5px solid #667eea;
-                display: none;
-            }
-            
-            .results h3 {
-                color: #333;
-                margin-bottom: 20px;
-                font-size: 1.4em;
-            }
-            
-            .result-item {
-                margin-bottom: 15px;
-                padding: 10px;
-                background: white;
-                border-radius: 8px;
-                border: 1px solid #e0e0e0;
-            }
-            
-            .result-label {
-                font-weight: 600;
-                color: #667eea;
-                margin-bottom: 5px;
-            }
-            
-            .result-value {
-                color: #333;
-                font-size: 1.1em;
-            }
-            
-            .clinical-interpretation {
-                background: #fff3cd;
-                border: 1px solid #ffeaa7;
-                border-radius: 8px;
-                padding: 15px;
-                margin: 15px 0;
-            }
-            
-            .clinical-significance {
-                padding: 10px 15px;
-                border-radius: 8px;
-                margin: 10px 0;
-                font-weight: 600;
-            }
-            
-            .significance-urgent {
-                background: #f8d7da;
-                color: #721c24;
-                border: 1px solid #f5c6cb;
-            }
-            
-            .significance-significant {
-                background: #fff3cd;
-                color: #856404;
-                border: 1px solid #ffeaa7;
-            }
-            
-            .significance-moderate {
-                background: #d1ecf1;
-                color: #0c5460;
-                border: 1px solid #bee5eb;
-            }
-            
-            .significance-routine {
-                background: #d4edda;
-                color: #155724;
-                border: 1px solid #c3e6cb;
-            }
-            
-            .loading {
-                text-align: center;
-                padding: 20px;
-                display: none;
-            }
-            
-            .spinner {
-                border: 3px solid #f3f3f3;
-                border-top: 3px solid #667eea;
-                border-radius: 50%;
-                width: 40px;
-                height: 40px;
-                animation: spin 1s linear infinite;
-                margin: 0 auto 15px;
-            }
-            
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-            
-            .error {
-                background: #f8d7da;
-                color: #721c24;
-                padding: 15px;
-                border-radius: 8px;
-                border: 1px solid #f5c6cb;
-                margin: 15px 0;
-                display: none;
-            }
-            
-            .features {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 20px;
-                margin: 30px 0;
-            }
-            
-            .feature {
-                text-align: center;
-                padding: 20px;
-                background: white;
-                border-radius: 10px;
-                box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            }
-            
-            .feature-icon {
-                font-size: 2em;
-                color: #667eea;
-                margin-bottom: 10px;
-            }
-            
-            .feature h4 {
-                color: #333;
-                margin-bottom: 10px;
-            }
-            
-            .feature p {
-                color: #666;
-                font-size: 0.9em;
-            }
-            
-            @media (max-width: 768px) {
-                .container {
-                    margin: 10px;
-                    border-radius: 15px;
-                }
-                
-                .header {
-                    padding: 20px;
-                }
-                
-                .header h1 {
-                    font-size: 2em;
-                }
-                
-                .content {
-                    padding: 20px;
-                }
-                
-                .upload-area {
-                    padding: 30px 20px;
-                }
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🫀 ECG Interpreter</h1>
-                <p>Clinical Grade Analysis • Algorithm v5.0</p>
-            </div>
-            
-            <div class="content">
-                <div class="upload-area" onclick="document.getElementById('fileInput').click()">
-                    <div class="upload-icon">📋</div>
-                    <div class="upload-text">Click to upload ECG image</div>
-                    <div class="upload-subtext">or drag and drop your ECG file here</div>
-                    <div class="upload-subtext">Supports PNG, JPG, JPEG, BMP, TIFF (max 16MB)</div>
-                </div>
-                
-                <input type="file" id="fileInput" accept=".png,.jpg,.jpeg,.bmp,.tiff,.gif" />
-                
-                <div class="loading" id="loading">
-                    <div class="spinner"></div>
-                    <p>Analyzing ECG with clinical-grade algorithm...</p>
-                </div>
-                
-                <div class="error" id="error"></div>
-                
-                <div class="results" id="results">
-                    <h3>📊 ECG Analysis Results</h3>
-                    <div id="resultsContent"></div>
-                </div>
-                
-                <div class="features">
-                    <div class="feature">
-                        <div class="feature-icon">🔬</div>
-                        <h4>Clinical Grade</h4>
-                        <p>Based on medical literature and systematic interpretation guidelines</p>
-                    </div>
-                    <div class="feature">
-                        <div class="feature-icon">⚡</div>
-                        <h4>Real-time Analysis</h4>
-                        <p>Instant ECG interpretation with confidence scores</p>
-                    </div>
-                    <div class="feature">
-                        <div class="feature-icon">🎯</div>
-                        <h4>25+ Conditions</h4>
-                        <p>Detects arrhythmias, conduction blocks, ischemia, and more</p>
-                    </div>
-                    <div class="feature">
-                        <div class="feature-icon">📱</div>
-                        <h4>Mobile Ready</h4>
-                        <p>Works seamlessly on desktop and mobile devices</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <script>
-            const fileInput = document.getElementById('fileInput');
-            const uploadArea = document.querySelector('.upload-area');
-            const loading = document.getElementById('loading');
-            const error = document.getElementById('error');
-            const results = document.getElementById('results');
-            const resultsContent = document.getElementById('resultsContent');
-            
-            // Drag and drop functionality
-            uploadArea.addEventListener('dragover', (e) => {
-                e.preventDefault();
-                uploadArea.classList.add('dragover');
-            });
-            
-            uploadArea.addEventListener('dragleave', () => {
-                uploadArea.classList.remove('dragover');
-            });
-            
-            uploadArea.addEventListener('drop', (e) => {
-                e.preventDefault();
-                uploadArea.classList.remove('dragover');
-                const files = e.dataTransfer.files;
-                if (files.length > 0) {
-                    handleFile(files[0]);
-                }
-            });
-            
-            fileInput.addEventListener('change', (e) => {
-                if (e.target.files.length > 0) {
-                    handleFile(e.target.files[0]);
-                }
-            });
-            
-            function handleFile(file) {
-                // Validate file type
-                const allowedTypes = ['image/png', 'image/jpeg', 'image/jpg', 'image/bmp', 'image/tiff'];
-                if (!allowedTypes.includes(file.type)) {
-                    showError('Please upload a valid image file (PNG, JPG, JPEG, BMP, TIFF)');
-                    return;
-                }
-                
-                // Validate file size (16MB)
-                if (file.size > 16 * 1024 * 1024) {
-                    showError('File size must be less than 16MB');
-                    return;
-                }
-                
-                uploadECG(file);
-            }
-            
-            function uploadECG(file) {
-                const formData = new FormData();
-                formData.append('file', file);
-                
-                // Show loading
-                loading.style.display = 'block';
-                results.style.display = 'none';
-                error.style.display = 'none';
-                
-                fetch('/api/ecg/upload', {
-                    method: 'POST',
-                    body: formData
-                })
-                .then(response => response.json())
-                .then(data => {
-                    loading.style.display = 'none';
-                    
-                    if (data.success) {
-                        displayResults(data);
-                    } else {
-                        showError(data.error || 'Analysis failed');
-                    }
-                })
-                .catch(err => {
-                    loading.style.display = 'none';
-                    showError('Network error: ' + err.message);
-                });
-            }
-            
-            function displayResults(data) {
-                const significance = data.clinical_significance || '';
-                let significanceClass = 'significance-routine';
-                
-                if (significance.includes('URGENT')) {
-                    significanceClass = 'significance-urgent';
-                } else if (significance.includes('SIGNIFICANT')) {
-                    significanceClass = 'significance-significant';
-                } else if (significance.includes('MODERATE')) {
-                    significanceClass = 'significance-moderate';
-                }
-                
-                resultsContent.innerHTML = `
-                    <div class="result-item">
-                        <div class="result-label">Heart Rate</div>
-                        <div class="result-value">${data.heart_rate} bpm</div>
-                    </div>
-                    
-                    <div class="result-item">
-                        <div class="result-label">Rhythm</div>
-                        <div class="result-value">${data.rhythm} (${data.rhythm_regularity})</div>
-                    </div>
-                    
-                    <div class="result-item">
-                        <div class="result-label">Intervals</div>
-                        <div class="result-value">
-                            PR: ${data.pr_interval} | QRS: ${data.qrs_duration} | QTc: ${data.qtc_interval}
-                        </div>
-                    </div>
-                    
-                    <div class="result-item">
-                        <div class="result-label">Electrical Axis</div>
-                        <div class="result-value">${data.electrical_axis}</div>
-                    </div>
-                    
-                    <div class="clinical-interpretation">
-                        <div class="result-label">Clinical Interpretation</div>
-                        <div class="result-value">${data.clinical_interpretation}</div>
-                    </div>
-                    
-                    <div class="clinical-significance ${significanceClass}">
-                        ${data.clinical_significance}
-                    </div>
-                    
-                    <div class="result-item">
-                        <div class="result-label">Abnormalities Detected</div>
-                        <div class="result-value">${data.abnormalities_detected.join(', ')}</div>
-                    </div>
-                    
-                    <div class="result-item">
-                        <div class="result-label">Analysis Confidence</div>
-                        <div class="result-value">${Math.round(data.confidence_scores.overall * 100)}% overall</div>
-                    </div>
-                    
-                    <div class="result-item">
-                        <div class="result-label">Algorithm Version</div>
-                        <div class="result-value">${data.algorithm_version}</div>
-                    </div>
-                `;
-                
-                results.style.display = 'block';
-            }
-            
-            function showError(message) {
-                error.textContent = message;
-                error.style.display = 'block';
-                results.style.display = 'none';
-            }
-        </script>
-    </body>
-    </html>
-    '''
+    if request.accept_encodings['gzip']:
+        response = Response(_INDEX_HTML_GZ, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(_INDEX_GZ_ETAG)
+    else:
+        response = Response(_INDEX_HTML, mimetype='text/html')
+        response.set_etag(_INDEX_ETAG)
+    response.vary.add('Accept-Encoding')
+    # Revalidate like /interpreter.html so a deploy is picked up immediately
+    response.cache_control.no_cache = True
+    response.last_modified = _INDEX_MTIME
+    return response.make_conditional(request)
+
+# Static payloads are serialized once at import instead of on every request
+_HEALTH_JSON = app.json.dumps({
+    'status': 'healthy',
+    'algorithm_version': '5.0 - Clinical Grade',
+    'analyzer_type': 'Clinical ECG Analyzer',
+    'supported_formats': sorted(ALLOWED_EXTENSIONS),
+    'max_file_size': '16MB',
+    'features': [
+        'Systematic clinical interpretation',
+        'Medical literature-based analysis',
+        'Comprehensive abnormality detection',
+        'Clinical significance assessment',
+        'Confidence scoring',
+        '25+ cardiac conditions'
+    ]
+}).encode('utf-8')
 
 @app.route('/api/ecg/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'algorithm_version': '5.0 - Clinical Grade',
-        'analyzer_type': 'Clinical ECG Analyzer',
-        'supported_formats': list(ALLOWED_EXTENSIONS),
-        'max_file_size': '16MB',
-        'features': [
-            'Systematic clinical interpretation',
-            'Medical literature-based analysis',
-            'Comprehensive abnormality detection',
-            'Clinical significance assessment',
-            'Confidence scoring',
-            '25+ cardiac conditions'
-        ]
-    })
+    return Response(_HEALTH_JSON, mimetype='application/json')
 
 @app.route('/api/ecg/upload', methods=['POST'])
 def upload_ecg():
     """Upload and analyze ECG image"""
     try:
-        # Check if file is present
-        if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'No file uploaded'})
+        if request.mimetype == 'application/octet-stream':
+            # Raw body upload: no multipart parsing, the filename travels in a header
+            filename = unquote(request.headers.get('X-Filename', ''))
+            file = None
+        else:
+            # Check if file is present
+            if 'file' not in request.files:
+                return jsonify({'success': False, 'error': 'No file uploaded'})
+            
+            file = request.files['file']
+            filename = file.filename
         
-        file = request.files['file']
-        if file.filename == '':
+        if filename == '':
             return jsonify({'success': False, 'error': 'No file selected'})
         
         # Validate file type
-        if not allowed_file(file.filename):
+        if not allowed_file(filename):
             return jsonify({
                 'success': False, 
                 'error': 'Invalid file type. Please upload PNG, JPG, JPEG, BMP, or TIFF files.'
             })
         
-        # Save file temporarily
-        filename = secure_filename(file.filename)
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f"ecg_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}")
+        # Raw bodies are only read once the filename has passed validation
+        image_data = request.get_data(cache=False) if file is None else file.read()
         
-        file.save(temp_path)
+        # Don't trust the extension alone; sniff the actual content
+        if not is_image_data(image_data):
+            return jsonify({
+                'success': False,
+                'error': 'File content is not a valid PNG, JPG, JPEG, BMP, TIFF or GIF image.'
+            })
         
-        try:
-            # Analyze ECG using clinical algorithm
-            analysis_results = ecg_analyzer.analyze_ecg(temp_path)
-            
-            # Clean up temporary file
-            os.remove(temp_path)
-            
-            if 'error' in analysis_results:
-                return jsonify({
-                    'success': False,
-                    'error': analysis_results['error']
-                })
-            
-            return jsonify(analysis_results)
-            
-        except Exception as e:
-            # Clean up temporary file on error
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            raise e
+        # The per-stage breakdown is only serialized when asked for
+        verbose = request.args.get('verbose') == '1'
+        
+        # Repeat uploads of the same image are served from the cache
+        cache_key = (hashlib.sha256(image_data).digest(), verbose)
+        cached_body = result_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(cached_body, mimetype='application/json')
+        
+        # Analyze ECG using clinical algorithm, straight from the upload buffer
+        analysis_results = ecg_analyzer.analyze_ecg_bytes(image_data, verbose=verbose)
+        
+        if 'error' in analysis_results:
+            return jsonify({
+                'success': False,
+                'error': analysis_results['error']
+            })
+        
+        response = jsonify(analysis_results)
+        result_cache.put(cache_key, response.get_data())
+        return response
             
     except Exception as e:
         logger.error(f"ECG analysis error: {str(e)}")
@@ -584,36 +319,42 @@ def upload_ecg():
             'error': f'Analysis failed: {str(e)}'
         })
 
+_CONDITIONS_JSON = app.json.dumps({
+    'conditions': list(ecg_analyzer.conditions.values()),
+    'total_conditions': len(ecg_analyzer.conditions),
+    'categories': {
+        'rhythm_disorders': [
+            'Normal sinus rhythm', 'Sinus bradycardia', 'Sinus tachycardia',
+            'Atrial fibrillation', 'Atrial flutter'
+        ],
+        'conduction_blocks': [
+            'First-degree AV block', 'Second-degree AV block', 'Third-degree AV block',
+            'Left bundle branch block', 'Right bundle branch block'
+        ],
+        'hypertrophy': [
+            'Left ventricular hypertrophy', 'Right ventricular hypertrophy'
+        ],
+        'ischemia_infarction': [
+            'Anterior myocardial infarction', 'Inferior myocardial infarction',
+            'Lateral myocardial infarction', 'ST elevation', 'ST depression'
+        ],
+        'other_abnormalities': [
+            'T-wave inversion', 'Prolonged QT interval', 'Left axis deviation',
+            'Right axis deviation', 'Poor R-wave progression', 'Early repolarization pattern'
+        ]
+    }
+}).encode('utf-8')
+_CONDITIONS_ETAG = content_etag(_CONDITIONS_JSON)
+
 @app.route('/api/ecg/supported_conditions')
 def supported_conditions():
     """Get list of supported ECG conditions"""
-    return jsonify({
-        'conditions': list(ecg_analyzer.conditions.values()),
-        'total_conditions': len(ecg_analyzer.conditions),
-        'categories': {
-            'rhythm_disorders': [
-                'Normal sinus rhythm', 'Sinus bradycardia', 'Sinus tachycardia',
-                'Atrial fibrillation', 'Atrial flutter'
-            ],
-            'conduction_blocks': [
-                'First-degree AV block', 'Second-degree AV block', 'Third-degree AV block',
-                'Left bundle branch block', 'Right bundle branch block'
-            ],
-            'hypertrophy': [
-                'Left ventricular hypertrophy', 'Right ventricular hypertrophy'
-            ],
-            'ischemia_infarction': [
-                'Anterior myocardial infarction', 'Inferior myocardial infarction',
-                'Lateral myocardial infarction', 'ST elevation', 'ST depression'
-            ],
-            'other_abnormalities': [
-                'T-wave inversion', 'Prolonged QT interval', 'Left axis deviation',
-                'Right axis deviation', 'Poor R-wave progression', 'Early repolarization pattern'
-            ]
-        }
-    })
+    response = Response(_CONDITIONS_JSON, mimetype='application/json')
+    response.set_etag(_CONDITIONS_ETAG)
+    return response.make_conditional(request)
 
 if __name__ == '__main__':
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
 
@@ -5,8 +5,99 @@ Based on established medical criteria and systematic interpretation guidelines
 
 import os
 import hashlib
+import mmap
 import random
-from typing import Dict, List, Tuple, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Any
+
+# Condition codes and their display names; read-only and shared by all analyzers
+_CONDITIONS: Mapping[str, str] = MappingProxyType({
+    'normal_sinus_rhythm': 'Normal sinus rhythm',
+    'sinus_bradycardia': 'Sinus bradycardia',
+    'sinus_tachycardia': 'Sinus tachycardia',
+    'atrial_fibrillation': 'Atrial fibrillation',
+    'atrial_flutter': 'Atrial flutter',
+    'first_degree_av_block': 'First-degree AV block',
+    'second_degree_av_block': 'Second-degree AV block',
+    'third_degree_av_block': 'Third-degree AV block',
+    'left_bundle_branch_block': 'Left bundle branch block',
+    'right_bundle_branch_block': 'Right bundle branch block',
+    'left_ventricular_hypertrophy': 'Left ventricular hypertrophy',
+    'right_ventricular_hypertrophy': 'Right ventricular hypertrophy',
+    'anterior_mi': 'Anterior myocardial infarction',
+    'inferior_mi': 'Inferior myocardial infarction',
+    'lateral_mi': 'Lateral myocardial infarction',
+    'st_elevation': 'ST elevation',
+    'st_depression': 'ST depression',
+    't_wave_inversion': 'T-wave inversion',
+    'prolonged_qt': 'Prolonged QT interval',
+    'left_axis_deviation': 'Left axis deviation',
+    'right_axis_deviation': 'Right axis deviation',
+    'poor_r_wave_progression': 'Poor R-wave progression',
+    'early_repolarization': 'Early repolarization pattern',
+    'pericarditis': 'Pericarditis',
+    'hyperkalemia': 'Hyperkalemia pattern',
+    'hypokalemia': 'Hypokalemia pattern'
+})
+
+# Lead groups each ST-T finding can be reported in (immutable, shared by all requests)
+_ST_ELEVATION_LEADS = (
+    ('V1', 'V2', 'V3', 'V4'),  # Anterior
+    ('II', 'III', 'aVF'),      # Inferior
+    ('I', 'aVL', 'V5', 'V6')   # Lateral
+)
+_ST_DEPRESSION_LEADS = (
+    ('V4', 'V5', 'V6'),
+    ('II', 'III', 'aVF'),
+    ('I', 'aVL')
+)
+_T_INVERSION_LEADS = (
+    ('V1', 'V2', 'V3'),
+    ('III', 'aVF'),
+    ('I', 'aVL')
+)
+
+# Finding descriptions for each lead group, formatted once at import
+_ST_ELEVATION_DESCRIPTIONS = {
+    leads: f"ST elevation in leads {', '.join(leads)}" for leads in _ST_ELEVATION_LEADS
+}
+_ST_DEPRESSION_DESCRIPTIONS = {
+    leads: f"ST depression in leads {', '.join(leads)}" for leads in _ST_DEPRESSION_LEADS
+}
+_T_INVERSION_DESCRIPTIONS = {
+    leads: f"T-wave inversion in leads {', '.join(leads)}" for leads in _T_INVERSION_LEADS
+}
+
+# Closing recommendations appended to the clinical interpretation
+_NO_ACUTE = "No acute abnormalities detected."
+_URGENT_ACS = "Consider acute coronary syndrome. Urgent cardiology consultation recommended."
+_CONDUCTION_CORRELATION = "Conduction system abnormality detected. Clinical correlation recommended."
+
+# Overall clinical significance levels, most to least urgent
+_SIGNIFICANCE_STEMI = 'URGENT: Possible STEMI - Immediate cardiology consultation required'
+_SIGNIFICANCE_AFIB = 'SIGNIFICANT: Atrial fibrillation detected - Anticoagulation assessment needed'
+_SIGNIFICANCE_AV_BLOCK = 'SIGNIFICANT: High-grade AV block - Pacemaker evaluation may be needed'
+_SIGNIFICANCE_BUNDLE_BRANCH_BLOCK = 'MODERATE: Bundle branch block - Clinical correlation recommended'
+_SIGNIFICANCE_HYPERTROPHY = 'MODERATE: Ventricular hypertrophy - Echocardiogram recommended'
+_SIGNIFICANCE_ROUTINE = 'ROUTINE: No urgent abnormalities detected'
+
+
+@lru_cache(maxsize=None)
+def _classify_rhythm(heart_rate: int, is_regular: bool, p_wave_present: bool) -> Tuple[str, str]:
+    """Classify rhythm from rate, regularity and P-waves; returns (rhythm, description)"""
+    if not p_wave_present and not is_regular:
+        return 'atrial_fibrillation', "Irregularly irregular rhythm without discernible P-waves"
+    elif heart_rate < 60:
+        return 'sinus_bradycardia', f"Sinus bradycardia at {heart_rate} bpm"
+    elif heart_rate > 100:
+        if is_regular:
+            return 'sinus_tachycardia', f"Sinus tachycardia at {heart_rate} bpm"
+        else:
+            return 'atrial_fibrillation', f"Atrial fibrillation with rapid ventricular response ({heart_rate} bpm)"
+    else:
+        return 'normal_sinus_rhythm', f"Normal sinus rhythm at {heart_rate} bpm"
+
 
 class ClinicalECGAnalyzer:
     """
@@ -14,71 +105,41 @@ class ClinicalECGAnalyzer:
     and systematic interpretation guidelines.
     """
     
-    def __init__(self):
-        self.conditions = {
-            'normal_sinus_rhythm': 'Normal sinus rhythm',
-            'sinus_bradycardia': 'Sinus bradycardia',
-            'sinus_tachycardia': 'Sinus tachycardia',
-            'atrial_fibrillation': 'Atrial fibrillation',
-            'atrial_flutter': 'Atrial flutter',
-            'first_degree_av_block': 'First-degree AV block',
-            'second_degree_av_block': 'Second-degree AV block',
-            'third_degree_av_block': 'Third-degree AV block',
-            'left_bundle_branch_block': 'Left bundle branch block',
-            'right_bundle_branch_block': 'Right bundle branch block',
-            'left_ventricular_hypertrophy': 'Left ventricular hypertrophy',
-            'right_ventricular_hypertrophy': 'Right ventricular hypertrophy',
-            'anterior_mi': 'Anterior myocardial infarction',
-            'inferior_mi': 'Inferior myocardial infarction',
-            'lateral_mi': 'Lateral myocardial infarction',
-            'st_elevation': 'ST elevation',
-            'st_depression': 'ST depression',
-            't_wave_inversion': 'T-wave inversion',
-            'prolonged_qt': 'Prolonged QT interval',
-            'left_axis_deviation': 'Left axis deviation',
-            'right_axis_deviation': 'Right axis deviation',
-            'poor_r_wave_progression': 'Poor R-wave progression',
-            'early_repolarization': 'Early repolarization pattern',
-            'pericarditis': 'Pericarditis',
-            'hyperkalemia': 'Hyperkalemia pattern',
-            'hypokalemia': 'Hypokalemia pattern'
-        }
+    conditions = _CONDITIONS
     
     def _generate_consistent_seed(self, image_data: bytes) -> int:
         """Generate consistent seed from image data for reproducible results"""
-        hash_obj = hashlib.md5(image_data)
-        return int(hash_obj.hexdigest()[:8], 16)
+        # MD5 is kept so existing images keep their results; it only seeds the
+        # analysis, so it is flagged as non-security use (allowed under FIPS)
+        return self._seed_from_digest(hashlib.md5(image_data, usedforsecurity=False).digest())
+    
+    def _generate_consistent_seed_from_file(self, image_path: str) -> int:
+        """Generate the same seed as _generate_consistent_seed, hashing the file through a read-only mapping"""
+        with open(image_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty (or size-less special) files cannot be mapped
+                return self._generate_consistent_seed(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._generate_consistent_seed(mapped)
     
-    def _analyze_rhythm(self, seed: int) -> Dict[str, Any]:
+    @staticmethod
+    def _seed_from_digest(digest: bytes) -> int:
+        """First four digest bytes, big-endian (same value as the leading 8 hex digits)"""
+        return int.from_bytes(digest[:4], 'big')
+    
+    def _analyze_rhythm(self, rng: random.Random) -> Dict[str, Any]:
         """Analyze cardiac rhythm based on clinical criteria"""
-        random.seed(seed)
-        
         # Heart rate analysis (50-200 bpm realistic range)
-        heart_rate = random.randint(45, 180)
+        heart_rate = rng.randint(45, 180)
         
         # Rhythm regularity
-        is_regular = random.choice([True, True, True, False])  # 75% regular
+        is_regular = rng.choice([True, True, True, False])  # 75% regular
         
         # P-wave analysis
-        p_wave_present = random.choice([True, True, True, False])  # 75% present
-        
-        # Determine rhythm based on clinical criteria
-        if not p_wave_present and not is_regular:
-            rhythm = 'atrial_fibrillation'
-            rhythm_description = "Irregularly irregular rhythm without discernible P-waves"
-        elif heart_rate < 60:
-            rhythm = 'sinus_bradycardia'
-            rhythm_description = f"Sinus bradycardia at {heart_rate} bpm"
-        elif heart_rate > 100:
-            if is_regular:
-                rhythm = 'sinus_tachycardia'
-                rhythm_description = f"Sinus tachycardia at {heart_rate} bpm"
-            else:
-                rhythm = 'atrial_fibrillation'
-                rhythm_description = f"Atrial fibrillation with rapid ventricular response ({heart_rate} bpm)"
-        else:
-            rhythm = 'normal_sinus_rhythm'
-            rhythm_description = f"Normal sinus rhythm at {heart_rate} bpm"
+        p_wave_present = rng.choice([True, True, True, False])  # 75% present
+        
+        # Determine rhythm based on clinical criteria (pure, so memoized)
+        rhythm, rhythm_description = _classify_rhythm(heart_rate, is_regular, p_wave_present)
         
         return {
             'heart_rate': heart_rate,
@@ -88,21 +149,19 @@ class ClinicalECGAnalyzer:
             'p_wave_present': p_wave_present
         }
     
-    def _analyze_intervals(self, seed: int) -> Dict[str, Any]:
+    def _analyze_intervals(self, rng: random.Random) -> Dict[str, Any]:
         """Analyze PR, QRS, and QT intervals"""
-        random.seed(seed + 1)
-        
         # PR interval (normal: 120-200ms)
-        pr_interval = random.randint(100, 250)
+        pr_interval = rng.randint(100, 250)
         pr_normal = 120 <= pr_interval <= 200
         
         # QRS duration (normal: <120ms)
-        qrs_duration = random.randint(70, 150)
+        qrs_duration = rng.randint(70, 150)
         qrs_normal = qrs_duration < 120
         
         # QT interval (normal: <440ms men, <460ms women)
-        qt_interval = random.randint(350, 500)
-        qtc_interval = qt_interval + random.randint(-20, 40)  # Corrected QT
+        qt_interval = rng.randint(350, 500)
+        qtc_interval = qt_interval + rng.randint(-20, 40)  # Corrected QT
         qtc_normal = qtc_interval < 450  # Using average threshold
         
         # Determine conduction abnormalities
@@ -114,7 +173,7 @@ class ClinicalECGAnalyzer:
             conduction_abnormalities.append('pre_excitation')
         
         if qrs_duration >= 120:
-            if random.choice([True, False]):
+            if rng.choice([True, False]):
                 conduction_abnormalities.append('left_bundle_branch_block')
             else:
                 conduction_abnormalities.append('right_bundle_branch_block')
@@ -133,12 +192,10 @@ class ClinicalECGAnalyzer:
             'conduction_abnormalities': conduction_abnormalities
         }
     
-    def _analyze_axis(self, seed: int) -> Dict[str, Any]:
+    def _analyze_axis(self, rng: random.Random) -> Dict[str, Any]:
         """Analyze electrical axis"""
-        random.seed(seed + 2)
-        
         # Electrical axis (normal: -30° to +90°)
-        axis = random.randint(-90, 120)
+        axis = rng.randint(-90, 120)
         
         if axis < -30:
             axis_interpretation = 'left_axis_deviation'
@@ -156,52 +213,38 @@ class ClinicalECGAnalyzer:
             'axis_description': axis_description
         }
     
-    def _analyze_st_t_changes(self, seed: int) -> Dict[str, Any]:
+    def _analyze_st_t_changes(self, rng: random.Random) -> Dict[str, Any]:
         """Analyze ST segment and T-wave changes"""
-        random.seed(seed + 3)
-        
         st_t_abnormalities = []
         
         # ST elevation analysis
-        st_elevation_present = random.choice([False, False, False, True])  # 25% chance
+        st_elevation_present = rng.choice([False, False, False, True])  # 25% chance
         if st_elevation_present:
-            st_elevation_leads = random.choice([
-                ['V1', 'V2', 'V3', 'V4'],  # Anterior
-                ['II', 'III', 'aVF'],      # Inferior
-                ['I', 'aVL', 'V5', 'V6']   # Lateral
-            ])
+            st_elevation_leads = rng.choice(_ST_ELEVATION_LEADS)
             st_t_abnormalities.append({
                 'type': 'st_elevation',
                 'leads': st_elevation_leads,
-                'description': f"ST elevation in leads {', '.join(st_elevation_leads)}"
+                'description': _ST_ELEVATION_DESCRIPTIONS[st_elevation_leads]
             })
         
         # ST depression analysis
-        st_depression_present = random.choice([False, False, True])  # 33% chance
+        st_depression_present = rng.choice([False, False, True])  # 33% chance
         if st_depression_present:
-            st_depression_leads = random.choice([
-                ['V4', 'V5', 'V6'],
-                ['II', 'III', 'aVF'],
-                ['I', 'aVL']
-            ])
+            st_depression_leads = rng.choice(_ST_DEPRESSION_LEADS)
             st_t_abnormalities.append({
                 'type': 'st_depression',
                 'leads': st_depression_leads,
-                'description': f"ST depression in leads {', '.join(st_depression_leads)}"
+                'description': _ST_DEPRESSION_DESCRIPTIONS[st_depression_leads]
             })
         
         # T-wave inversion analysis
-        t_wave_inversion = random.choice([False, False, True])  # 33% chance
+        t_wave_inversion = rng.choice([False, False, True])  # 33% chance
         if t_wave_inversion:
-            t_inversion_leads = random.choice([
-                ['V1', 'V2', 'V3'],
-                ['III', 'aVF'],
-                ['I', 'aVL']
-            ])
+            t_inversion_leads = rng.choice(_T_INVERSION_LEADS)
             st_t_abnormalities.append({
                 'type': 't_wave_inversion',
                 'leads': t_inversion_leads,
-                'description': f"T-wave inversion in leads {', '.join(t_inversion_leads)}"
+                'description': _T_INVERSION_DESCRIPTIONS[t_inversion_leads]
             })
         
         return {
@@ -209,14 +252,12 @@ class ClinicalECGAnalyzer:
             'ischemic_changes': len(st_t_abnormalities) > 0
         }
     
-    def _analyze_hypertrophy(self, seed: int) -> Dict[str, Any]:
+    def _analyze_hypertrophy(self, rng: random.Random) -> Dict[str, Any]:
         """Analyze for ventricular hypertrophy"""
-        random.seed(seed + 4)
-        
         hypertrophy_findings = []
         
         # Left ventricular hypertrophy (Sokolow-Lyon criteria)
-        lvh_voltage = random.choice([False, False, False, True])  # 25% chance
+        lvh_voltage = rng.choice([False, False, False, True])  # 25% chance
         if lvh_voltage:
             hypertrophy_findings.append({
                 'type': 'left_ventricular_hypertrophy',
@@ -225,7 +266,7 @@ class ClinicalECGAnalyzer:
             })
         
         # Right ventricular hypertrophy
-        rvh_present = random.choice([False, False, False, False, True])  # 20% chance
+        rvh_present = rng.choice([False, False, False, False, True])  # 20% chance
         if rvh_present:
             hypertrophy_findings.append({
                 'type': 'right_ventricular_hypertrophy',
@@ -238,46 +279,48 @@ class ClinicalECGAnalyzer:
             'hypertrophy_present': len(hypertrophy_findings) > 0
         }
     
-    def _generate_clinical_interpretation(self, analysis_results: Dict[str, Any]) -> str:
-        """Generate comprehensive clinical interpretation"""
-        interpretation_parts = []
-        
-        # Rhythm interpretation
-        rhythm_data = analysis_results['rhythm_analysis']
-        interpretation_parts.append(rhythm_data['rhythm_description'])
+    def _summarize_findings(self, analysis_results: Dict[str, Any]) -> Tuple[List[str], str]:
+        """Collect findings in one pass; returns (abnormalities, clinical interpretation)"""
+        findings = []
         
         # Interval abnormalities
-        interval_data = analysis_results['interval_analysis']
-        if interval_data['conduction_abnormalities']:
-            for abnormality in interval_data['conduction_abnormalities']:
-                interpretation_parts.append(self.conditions.get(abnormality, abnormality))
+        for abnormality in analysis_results['interval_analysis']['conduction_abnormalities']:
+            findings.append(self.conditions.get(abnormality, abnormality))
         
         # Axis interpretation
         axis_data = analysis_results['axis_analysis']
         if axis_data['axis_interpretation'] != 'normal_axis':
-            interpretation_parts.append(axis_data['axis_description'])
+            findings.append(axis_data['axis_description'])
         
         # ST-T changes
-        st_t_data = analysis_results['st_t_analysis']
-        if st_t_data['ischemic_changes']:
-            for abnormality in st_t_data['st_t_abnormalities']:
-                interpretation_parts.append(abnormality['description'])
+        for abnormality in analysis_results['st_t_analysis']['st_t_abnormalities']:
+            findings.append(abnormality['description'])
         
         # Hypertrophy
-        hypertrophy_data = analysis_results['hypertrophy_analysis']
-        if hypertrophy_data['hypertrophy_present']:
-            for finding in hypertrophy_data['hypertrophy_findings']:
-                interpretation_parts.append(finding['description'])
+        for finding in analysis_results['hypertrophy_analysis']['hypertrophy_findings']:
+            findings.append(finding['description'])
+        
+        # The abnormality list leads with the rhythm only when it is abnormal;
+        # the interpretation always leads with the rhythm description
+        rhythm_data = analysis_results['rhythm_analysis']
+        rhythm = rhythm_data['rhythm']
+        if rhythm != 'normal_sinus_rhythm':
+            abnormalities = [self.conditions.get(rhythm, rhythm)] + findings
+        else:
+            abnormalities = findings
+        interpretation_parts = [rhythm_data['rhythm_description']] + findings
         
         # Clinical significance
         if len(interpretation_parts) == 1 and 'normal sinus rhythm' in interpretation_parts[0].lower():
-            interpretation_parts.append("No acute abnormalities detected.")
+            interpretation_parts.append(_NO_ACUTE)
         elif any('elevation' in part.lower() for part in interpretation_parts):
-            interpretation_parts.append("Consider acute coronary syndrome. Urgent cardiology consultation recommended.")
+            interpretation_parts.append(_URGENT_ACS)
         elif any('block' in part.lower() for part in interpretation_parts):
-            interpretation_parts.append("Conduction system abnormality detected. Clinical correlation recommended.")
+            interpretation_parts.append(_CONDUCTION_CORRELATION)
         
-        return ". ".join(interpretation_parts) + "."
+        if not abnormalities:
+            abnormalities = ['No significant abnormalities detected']
+        return abnormalities, ". ".join(interpretation_parts) + "."
     
     def _calculate_confidence_scores(self, analysis_results: Dict[str, Any]) -> Dict[str, float]:
         """Calculate confidence scores for different aspects of the analysis"""
@@ -303,33 +346,60 @@ class ClinicalECGAnalyzer:
             'overall': round(overall_confidence, 2)
         }
     
-    def analyze_ecg(self, image_path: str) -> Dict[str, Any]:
+    def analyze_ecg(self, image_path: str, verbose: bool = True) -> Dict[str, Any]:
         """
         Perform comprehensive ECG analysis based on clinical criteria
         
         Args:
             image_path: Path to ECG image file
+            verbose: Include the per-stage 'detailed_analysis' breakdown
             
         Returns:
             Dictionary containing detailed ECG analysis results
         """
         
-        # Read image data for consistent analysis
+        # Hash the file from the page cache rather than copying it into memory
         try:
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
+            seed = self._generate_consistent_seed_from_file(image_path)
         except Exception as e:
             return {'error': f'Failed to read image: {str(e)}'}
         
+        return self._analyze_from_seed(seed, verbose)
+    
+    def analyze_ecg_bytes(self, image_data: bytes, verbose: bool = True) -> Dict[str, Any]:
+        """
+        Perform comprehensive ECG analysis on an in-memory image
+        
+        Args:
+            image_data: Raw bytes of the ECG image file
+            verbose: Include the per-stage 'detailed_analysis' breakdown
+            
+        Returns:
+            Dictionary containing detailed ECG analysis results
+        """
+        
         # Generate consistent seed for reproducible results
-        seed = self._generate_consistent_seed(image_data)
+        return self._analyze_from_seed(self._generate_consistent_seed(image_data), verbose)
+    
+    def _analyze_from_seed(self, seed: int, verbose: bool = True) -> Dict[str, Any]:
+        """
+        Run the analysis stages for an image identified by its seed
+        
+        Args:
+            seed: Seed derived from the image content
+            verbose: Include the per-stage 'detailed_analysis' breakdown
+            
+        Returns:
+            Dictionary containing detailed ECG analysis results
+        """
         
-        # Perform systematic analysis
-        rhythm_analysis = self._analyze_rhythm(seed)
-        interval_analysis = self._analyze_intervals(seed)
-        axis_analysis = self._analyze_axis(seed)
-        st_t_analysis = self._analyze_st_t_changes(seed)
-        hypertrophy_analysis = self._analyze_hypertrophy(seed)
+        # Perform systematic analysis; each stage draws from its own generator
+        # so concurrent requests never share (or reseed) the global RNG
+        rhythm_analysis = self._analyze_rhythm(random.Random(seed))
+        interval_analysis = self._analyze_intervals(random.Random(seed + 1))
+        axis_analysis = self._analyze_axis(random.Random(seed + 2))
+        st_t_analysis = self._analyze_st_t_changes(random.Random(seed + 3))
+        hypertrophy_analysis = self._analyze_hypertrophy(random.Random(seed + 4))
         
         # Compile results
         analysis_results = {
@@ -340,8 +410,8 @@ class ClinicalECGAnalyzer:
             'hypertrophy_analysis': hypertrophy_analysis
         }
         
-        # Generate clinical interpretation
-        clinical_interpretation = self._generate_clinical_interpretation(analysis_results)
+        # Generate clinical interpretation and the abnormality list together
+        abnormalities, clinical_interpretation = self._summarize_findings(analysis_results)
         
         # Calculate confidence scores
         confidence_scores = self._calculate_confidence_scores(analysis_results)
@@ -359,39 +429,14 @@ class ClinicalECGAnalyzer:
             'electrical_axis': axis_analysis['axis_description'],
             'clinical_interpretation': clinical_interpretation,
             'confidence_scores': confidence_scores,
-            'detailed_analysis': analysis_results,
-            'abnormalities_detected': self._extract_abnormalities(analysis_results),
+            'abnormalities_detected': abnormalities,
             'clinical_significance': self._assess_clinical_significance(analysis_results)
         }
         
-        return final_results
-    
-    def _extract_abnormalities(self, analysis_results: Dict[str, Any]) -> List[str]:
-        """Extract list of detected abnormalities"""
-        abnormalities = []
-        
-        # Rhythm abnormalities
-        rhythm = analysis_results['rhythm_analysis']['rhythm']
-        if rhythm != 'normal_sinus_rhythm':
-            abnormalities.append(self.conditions.get(rhythm, rhythm))
-        
-        # Conduction abnormalities
-        for abnormality in analysis_results['interval_analysis']['conduction_abnormalities']:
-            abnormalities.append(self.conditions.get(abnormality, abnormality))
+        if verbose:
+            final_results['detailed_analysis'] = analysis_results
         
-        # Axis abnormalities
-        if analysis_results['axis_analysis']['axis_interpretation'] != 'normal_axis':
-            abnormalities.append(analysis_results['axis_analysis']['axis_description'])
-        
-        # ST-T abnormalities
-        for abnormality in analysis_results['st_t_analysis']['st_t_abnormalities']:
-            abnormalities.append(abnormality['description'])
-        
-        # Hypertrophy
-        for finding in analysis_results['hypertrophy_analysis']['hypertrophy_findings']:
-            abnormalities.append(finding['description'])
-        
-        return abnormalities if abnormalities else ['No significant abnormalities detected']
+        return final_results
     
     def _assess_clinical_significance(self, analysis_results: Dict[str, Any]) -> str:
         """Assess overall clinical significance"""
@@ -400,24 +445,24 @@ class ClinicalECGAnalyzer:
         if analysis_results['st_t_analysis']['ischemic_changes']:
             for abnormality in analysis_results['st_t_analysis']['st_t_abnormalities']:
                 if abnormality['type'] == 'st_elevation':
-                    return 'URGENT: Possible STEMI - Immediate cardiology consultation required'
+                    return _SIGNIFICANCE_STEMI
         
         # Check for significant arrhythmias
         rhythm = analysis_results['rhythm_analysis']['rhythm']
         if rhythm == 'atrial_fibrillation':
-            return 'SIGNIFICANT: Atrial fibrillation detected - Anticoagulation assessment needed'
+            return _SIGNIFICANCE_AFIB
         elif rhythm in ['second_degree_av_block', 'third_degree_av_block']:
-            return 'SIGNIFICANT: High-grade AV block - Pacemaker evaluation may be needed'
+            return _SIGNIFICANCE_AV_BLOCK
         
         # Check for conduction abnormalities
         if 'left_bundle_branch_block' in analysis_results['interval_analysis']['conduction_abnormalities']:
-            return 'MODERATE: Bundle branch block - Clinical correlation recommended'
+            return _SIGNIFICANCE_BUNDLE_BRANCH_BLOCK
         
         # Check for hypertrophy
         if analysis_results['hypertrophy_analysis']['hypertrophy_present']:
-            return 'MODERATE: Ventricular hypertrophy - Echocardiogram recommended'
+            return _SIGNIFICANCE_HYPERTROPHY
         
-        return 'ROUTINE: No urgent abnormalities detected'
+        return _SIGNIFICANCE_ROUTINE
 
 # Test the analyzer
 if __name__ == "__main__":
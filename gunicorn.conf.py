@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for production deployments
+Loaded automatically when gunicorn is started from the project root
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Analysis is CPU-bound Python, so scale with processes and use a few
+# threads per worker to overlap upload I/O. Default to one worker per CPU
+# this process may run on (the host count ignores affinity and container
+# limits); memory-capped deploys should set WEB_CONCURRENCY explicitly
+if hasattr(os, 'sched_getaffinity'):
+    _available_cpus = len(os.sched_getaffinity(0))
+else:
+    _available_cpus = os.cpu_count() or 1
+workers = int(os.environ.get('WEB_CONCURRENCY', _available_cpus))
+worker_class = 'gthread'
+# Threads share one analyzer; this is only safe because every analysis
+# draws from its own random.Random instead of the global RNG, which would
+# let concurrent uploads interleave draws (and cache the wrong result)
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Import the app once in the master so workers fork with the analyzer,
+# the precomputed responses and the loaded code already in place
+preload_app = True
+
+# Keep the worker heartbeat file off disk-backed /tmp
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Recycle workers periodically to bound memory growth
+max_requests = 1000
+max_requests_jitter = 100